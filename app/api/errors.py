@@ -2,6 +2,7 @@ from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
 from app.services.books import NotFoundError
+from app.services.changes import ChangeFeedGoneError
 
 
 def register_exception_handlers(app: FastAPI) -> None:
@@ -9,6 +10,10 @@ def register_exception_handlers(app: FastAPI) -> None:
     async def not_found_handler(_, exc: NotFoundError):
         return JSONResponse(status_code=404, content={"detail": str(exc)})
 
+    @app.exception_handler(ChangeFeedGoneError)
+    async def change_feed_gone_handler(_, exc: ChangeFeedGoneError):
+        return JSONResponse(status_code=410, content={"detail": str(exc)})
+
     @app.exception_handler(ValueError)
     async def value_error_handler(_, exc: ValueError):
         return JSONResponse(status_code=400, content={"detail": str(exc)})
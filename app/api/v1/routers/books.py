@@ -1,11 +1,15 @@
-from typing import Optional
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
 from fastapi import Request, status
+from fastapi.responses import StreamingResponse
 
 from app.api.deps import pagination_params
-from app.domain.schemas import BookCreate, BookOut, BookUpdate, PaginatedBooks
+from app.domain.schemas import BookCreate, BookOut, BookUpdate, ChangesPage, PaginatedBooks
+from app.services.changes import ChangeFeedGoneError
 
 router = APIRouter(prefix="/books", tags=["books"])
 
@@ -18,9 +22,13 @@ def get_service(request: Request):
 async def list_books(
     request: Request,
     q: Optional[str] = Query(None),
-    author: Optional[str] = Query(None),
-    genre: Optional[str] = Query(None),
+    author: Optional[List[str]] = Query(None, description="Repeat or comma-separate; matches any"),
+    genre: Optional[List[str]] = Query(None, description="Repeat or comma-separate; matches any"),
     year: Optional[int] = Query(None),
+    year_from: Optional[int] = Query(None),
+    year_to: Optional[int] = Query(None),
+    created_after: Optional[datetime] = Query(None),
+    updated_since: Optional[datetime] = Query(None),
     available: Optional[bool] = Query(None),
     page=Depends(pagination_params),
 ):
@@ -30,6 +38,10 @@ async def list_books(
         author=author,
         genre=genre,
         year=year,
+        year_from=year_from,
+        year_to=year_to,
+        created_after=created_after,
+        updated_since=updated_since,
         available=available,
         sort=page["sort"],
         order=page["order"],
@@ -39,6 +51,62 @@ async def list_books(
     return {"items": items, "total": total, **page}
 
 
+@router.get("/changes", response_model=ChangesPage)
+async def list_changes(
+    request: Request,
+    since: int = Query(0, ge=0),
+    epoch: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    timeout: float = Query(0, ge=0, le=60),
+    accept: Optional[str] = Header(None),
+    last_event_id: Optional[str] = Header(None),
+):
+    svc = get_service(request)
+    if last_event_id is not None:
+        epoch, since = _parse_event_id(last_event_id)
+    if accept and "text/event-stream" in accept:
+        return StreamingResponse(
+            _change_events(request, since, epoch, limit, timeout or 15),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
+    items, latest, epoch = await svc.list_changes(
+        since=since, epoch=epoch, limit=limit, timeout=timeout
+    )
+    next_since = items[-1]["seq"] if items else since
+    return {"items": items, "epoch": epoch, "latest_seq": latest, "next_since": next_since}
+
+
+def _parse_event_id(value: str) -> Tuple[Optional[str], int]:
+    # SSE ids are "<epoch>:<seq>"; a bare seq is accepted too
+    epoch, _, seq = value.strip().rpartition(":")
+    if not seq.isdigit():
+        raise ValueError("invalid Last-Event-ID")
+    return epoch or None, int(seq)
+
+
+async def _change_events(
+    request: Request, since: int, epoch: Optional[str], limit: int, heartbeat: float
+):
+    svc = get_service(request)
+    cursor = since
+    while not await request.is_disconnected():
+        try:
+            items, _, epoch = await svc.list_changes(
+                since=cursor, epoch=epoch, limit=limit, timeout=heartbeat
+            )
+        except ChangeFeedGoneError as exc:
+            yield f"event: reset\ndata: {json.dumps({'detail': str(exc)})}\n\n"
+            return
+        if not items:
+            yield ": keep-alive\n\n"
+            continue
+        for item in items:
+            event_id = f"{epoch}:{item['seq']}"
+            yield f"id: {event_id}\nevent: {item['op']}\ndata: {json.dumps(item)}\n\n"
+        cursor = items[-1]["seq"]
+
+
 @router.post("", response_model=BookOut, status_code=status.HTTP_201_CREATED)
 async def create_book(request: Request, payload: BookCreate):
     svc = get_service(request)
@@ -11,6 +11,7 @@ class Settings(BaseModel):
     MAX_FILE_SIZE_MB: int = 10
     ENABLE_BACKUPS: bool = True
     BACKUP_EVERY_N_WRITES: int = 50
+    CHANGE_FEED_MAX_ENTRIES: int = 1000
     CORS_ORIGINS: str = "*"
     LOG_LEVEL: str = "INFO"
 
@@ -24,6 +25,7 @@ class Settings(BaseModel):
             MAX_FILE_SIZE_MB=int(os.getenv("MAX_FILE_SIZE_MB", "10")),
             ENABLE_BACKUPS=os.getenv("ENABLE_BACKUPS", "true").lower() in ("1", "true", "yes"),
             BACKUP_EVERY_N_WRITES=int(os.getenv("BACKUP_EVERY_N_WRITES", "50")),
+            CHANGE_FEED_MAX_ENTRIES=int(os.getenv("CHANGE_FEED_MAX_ENTRIES", "1000")),
             CORS_ORIGINS=os.getenv("CORS_ORIGINS", "*"),
             LOG_LEVEL=os.getenv("LOG_LEVEL", "INFO"),
         )
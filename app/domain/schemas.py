@@ -60,3 +60,18 @@ class PaginatedBooks(BaseModel):
     total: int
     limit: int
     offset: int
+
+
+class ChangeOut(BaseModel):
+    seq: int
+    op: str
+    id: UUID
+    at: datetime
+    book: Optional[BookOut] = None
+
+
+class ChangesPage(BaseModel):
+    items: List[ChangeOut]
+    epoch: str
+    latest_seq: int
+    next_since: int
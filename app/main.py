@@ -34,7 +34,8 @@ def create_app() -> FastAPI:
     # Services wiring
     store = JsonStore(settings.DATA_DIR, settings.DATA_FILE, settings.DATA_LOCK_FILE,
                       enable_backups=settings.ENABLE_BACKUPS,
-                      backup_every_n_writes=settings.BACKUP_EVERY_N_WRITES)
+                      backup_every_n_writes=settings.BACKUP_EVERY_N_WRITES,
+                      max_changes=settings.CHANGE_FEED_MAX_ENTRIES)
     service = BooksService(store)
     app.state.books_service = service
 
@@ -1,11 +1,12 @@
 from __future__ import annotations
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from app.domain.models import Book
 from app.domain.schemas import BookCreate, BookUpdate
 from app.services.storage.json_store import JsonStore
+from app.services.changes import ChangeFeed
 from app.services.index import Indexer
 
 
@@ -16,18 +17,33 @@ class NotFoundError(Exception):
 class BooksService:
     def __init__(self, store: JsonStore) -> None:
         self.store = store
+        self.changes = ChangeFeed(store)
+        self._index: Optional[Tuple[Dict[str, dict], int, Indexer]] = None
 
     async def _load(self) -> Tuple[int, Dict[str, dict]]:
         total, books = await self.store.list_books()
         return total, books
 
+    async def _get_index(self, books: Dict[str, dict]) -> Indexer:
+        # Reuse the sorted indexes until a mutation bumps the change seq or the file is reloaded
+        seq = int((await self.store.get_changes()).get("seq", 0))
+        if self._index is not None and self._index[0] is books and self._index[1] == seq:
+            return self._index[2]
+        index = Indexer.build(books)
+        self._index = (books, seq, index)
+        return index
+
     async def list_books(
         self,
         *,
         q: Optional[str] = None,
-        author: Optional[str] = None,
-        genre: Optional[str] = None,
+        author: Union[str, List[str], None] = None,
+        genre: Union[str, List[str], None] = None,
         year: Optional[int] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        created_after: Optional[datetime] = None,
+        updated_since: Optional[datetime] = None,
         available: Optional[bool] = None,
         sort: str = "created_at",
         order: str = "asc",
@@ -35,13 +51,17 @@ class BooksService:
         offset: int = 0,
     ) -> Tuple[List[dict], int]:
         _, books = await self._load()
-        index = Indexer.build(books)
+        index = await self._get_index(books)
         items, total = index.query(
             books,
             q=q,
             author=author,
             genre=genre,
             year=year,
+            year_from=year_from,
+            year_to=year_to,
+            created_after=created_after,
+            updated_since=updated_since,
             available=available,
             sort=sort,
             order=order,
@@ -50,6 +70,21 @@ class BooksService:
         )
         return items, total
 
+    async def list_changes(
+        self,
+        *,
+        since: int = 0,
+        epoch: Optional[str] = None,
+        limit: int = 100,
+        timeout: float = 0,
+    ) -> Tuple[List[dict], int, str]:
+        items, latest, current = await self.changes.since(since, limit, epoch)
+        if not items and timeout > 0:
+            # Long-poll: park until a mutation lands past the cursor
+            await self.changes.wait(since, timeout)
+            items, latest, current = await self.changes.since(since, limit, epoch)
+        return items, latest, current
+
     async def create_book(self, payload: BookCreate) -> dict:
         now = datetime.utcnow()
         book = Book(
@@ -63,8 +98,9 @@ class BooksService:
             created_at=now,
             updated_at=now,
         )
-        data = book.model_dump()
-        await self.store.upsert_book(str(book.id), data)
+        data = book.model_dump(mode="json")
+        await self.store.upsert_book(str(book.id), data, op="create")
+        await self.changes.notify()
         return data
 
     async def get_book(self, book_id: UUID) -> dict:
@@ -87,10 +123,12 @@ class BooksService:
         if avail > total:
             raise ValueError("available_copies cannot exceed total_copies")
         updated["updated_at"] = datetime.utcnow().isoformat()
-        await self.store.upsert_book(str(book_id), updated)
+        await self.store.upsert_book(str(book_id), updated, op="update")
+        await self.changes.notify()
         return updated
 
     async def delete_book(self, book_id: UUID) -> None:
         ok = await self.store.delete_book(str(book_id))
         if not ok:
             raise NotFoundError("book not found")
+        await self.changes.notify()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+import asyncio
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+from app.services.storage.json_store import JsonStore
+
+
+class ChangeFeedGoneError(Exception):
+    pass
+
+
+class ChangeFeed:
+    def __init__(self, store: JsonStore) -> None:
+        self.store = store
+        self._cond = asyncio.Condition()
+        self._latest: Optional[int] = None
+
+    async def _observe(self) -> Tuple[dict, int]:
+        changes = await self.store.get_changes()
+        latest = int(changes.get("seq", 0))
+        if self._latest is not None and latest < self._latest:
+            # Seq went backwards (backup restored / file edited): old cursors may now
+            # point at different mutations, so start a new epoch to invalidate them
+            await self.store.reset_changes_epoch()
+            changes = await self.store.get_changes()
+        self._latest = latest
+        return changes, latest
+
+    async def since(
+        self, seq: int, limit: int = 100, epoch: Optional[str] = None
+    ) -> Tuple[List[dict], int, str]:
+        changes, latest = await self._observe()
+        entries: List[dict] = changes.get("entries", [])
+        # Cursor from another epoch, ahead of the store, or older than the retained window
+        oldest = entries[0]["seq"] - 1 if entries else latest
+        if (epoch and epoch != changes["epoch"]) or seq > latest or seq < oldest:
+            raise ChangeFeedGoneError("change feed cursor expired; resync required")
+        start = bisect_right(entries, seq, key=lambda e: e["seq"])
+        return entries[start : start + limit], latest, changes["epoch"]
+
+    async def wait(self, seq: int, timeout: float) -> None:
+        async with self._cond:
+            try:
+                await asyncio.wait_for(
+                    self._cond.wait_for(lambda: (self._latest or 0) > seq), timeout
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def notify(self) -> None:
+        await self._observe()
+        async with self._cond:
+            self._cond.notify_all()
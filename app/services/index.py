@@ -1,6 +1,59 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+# (size, materialize, contains) for one filter; sizes come from index bounds, not copies
+Posting = Tuple[int, Callable[[], Iterable[str]], Callable[[str], bool]]
+
+
+def _terms(
+    values: Union[str, Sequence[str], None], index: Dict[str, List[str]]
+) -> Optional[List[str]]:
+    # An exact key wins ("Tolkien, J.R.R."); otherwise treat commas as separators.
+    # None means no filter; an empty list (e.g. "author=,") matches nothing.
+    if isinstance(values, str):
+        values = [values]
+    if not any((v or "").strip() for v in values or []):
+        return None
+    terms: List[str] = []
+    for value in values or []:
+        key = (value or "").strip().lower()
+        if key in index:
+            terms.append(key)
+        else:
+            terms.extend(v.strip().lower() for v in key.split(",") if v.strip())
+    return terms
+
+
+def _naive_utc(dt: datetime) -> datetime:
+    # Stored timestamps are naive UTC; align aware inputs before comparing
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _parse_ts(value) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return _naive_utc(value)
+    try:
+        return _naive_utc(datetime.fromisoformat(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _sorted_keys(pairs: List[Tuple[datetime, str]]) -> Tuple[List[datetime], List[str]]:
+    pairs.sort()
+    return [k for k, _ in pairs], [bid for _, bid in pairs]
+
+
+def _union(index: Dict, keys: Iterable) -> Set[str]:
+    return set().union(*(index.get(k, []) for k in keys))
+
+
+def _ranks(ids: List[str]) -> Dict[str, int]:
+    return {bid: i for i, bid in enumerate(ids)}
 
 
 @dataclass
@@ -8,12 +61,23 @@ class Indexer:
     by_author: Dict[str, List[str]]
     by_genre: Dict[str, List[str]]
     by_year: Dict[int, List[str]]
+    # Sorted key arrays for range lookups via bisect
+    years: List[int] = field(default_factory=list)
+    year_offsets: List[int] = field(default_factory=lambda: [0])
+    created_keys: List[datetime] = field(default_factory=list)
+    created_ids: List[str] = field(default_factory=list)
+    created_rank: Dict[str, int] = field(default_factory=dict)
+    updated_keys: List[datetime] = field(default_factory=list)
+    updated_ids: List[str] = field(default_factory=list)
+    updated_rank: Dict[str, int] = field(default_factory=dict)
 
     @staticmethod
     def build(books: Dict[str, dict]) -> "Indexer":
         by_author: Dict[str, List[str]] = {}
         by_genre: Dict[str, List[str]] = {}
         by_year: Dict[int, List[str]] = {}
+        created: List[Tuple[datetime, str]] = []
+        updated: List[Tuple[datetime, str]] = []
         for bid, b in books.items():
             author = (b.get("author") or "").strip().lower()
             if author:
@@ -25,31 +89,128 @@ class Indexer:
             year = b.get("published_year")
             if isinstance(year, int):
                 by_year.setdefault(year, []).append(bid)
-        return Indexer(by_author=by_author, by_genre=by_genre, by_year=by_year)
+            created_at = _parse_ts(b.get("created_at"))
+            if created_at is not None:
+                created.append((created_at, bid))
+            updated_at = _parse_ts(b.get("updated_at"))
+            if updated_at is not None:
+                updated.append((updated_at, bid))
+        created_keys, created_ids = _sorted_keys(created)
+        updated_keys, updated_ids = _sorted_keys(updated)
+        years = sorted(by_year)
+        # Prefix sums of posting sizes so a year range is sized in O(1)
+        year_offsets = [0]
+        for y in years:
+            year_offsets.append(year_offsets[-1] + len(by_year[y]))
+        return Indexer(
+            by_author=by_author,
+            by_genre=by_genre,
+            by_year=by_year,
+            years=years,
+            year_offsets=year_offsets,
+            created_keys=created_keys,
+            created_ids=created_ids,
+            created_rank=_ranks(created_ids),
+            updated_keys=updated_keys,
+            updated_ids=updated_ids,
+            updated_rank=_ranks(updated_ids),
+        )
 
     def query(
         self,
         books: Dict[str, dict],
         q: Optional[str] = None,
-        author: Optional[str] = None,
-        genre: Optional[str] = None,
+        author: Union[str, Sequence[str], None] = None,
+        genre: Union[str, Sequence[str], None] = None,
         year: Optional[int] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        created_after: Optional[datetime] = None,
+        updated_since: Optional[datetime] = None,
         available: Optional[bool] = None,
         sort: str = "created_at",
         order: str = "asc",
         limit: int = 20,
         offset: int = 0,
     ) -> Tuple[List[dict], int]:
-        # Candidate set via indices
-        candidates: Iterable[str] = books.keys()
-        if author:
-            candidates = set(self.by_author.get(author.strip().lower(), []))
-        if genre:
-            gset = set(self.by_genre.get(genre.strip().lower(), []))
-            candidates = set(candidates) & gset
+        # Candidate set via indices: one posting per filter, multi-values unioned
+        postings: List[Posting] = []
+        authors = _terms(author, self.by_author)
+        if authors is not None:
+            akeys = set(authors)
+            postings.append(
+                (
+                    sum(len(self.by_author.get(a, [])) for a in akeys),
+                    lambda: _union(self.by_author, akeys),
+                    lambda bid: (books[bid].get("author") or "").strip().lower() in akeys,
+                )
+            )
+        genres = _terms(genre, self.by_genre)
+        if genres is not None:
+            gkeys = set(genres)
+            postings.append(
+                (
+                    sum(len(self.by_genre.get(g, [])) for g in gkeys),
+                    lambda: _union(self.by_genre, gkeys),
+                    lambda bid: any(
+                        (g or "").strip().lower() in gkeys
+                        for g in books[bid].get("genres", []) or []
+                    ),
+                )
+            )
         if year is not None:
-            yset = set(self.by_year.get(year, []))
-            candidates = set(candidates) & yset
+            postings.append(
+                (
+                    len(self.by_year.get(year, [])),
+                    lambda: self.by_year.get(year, []),
+                    lambda bid: books[bid].get("published_year") == year,
+                )
+            )
+        if year_from is not None or year_to is not None:
+            lo = bisect_left(self.years, year_from) if year_from is not None else 0
+            hi = bisect_right(self.years, year_to) if year_to is not None else len(self.years)
+            ylo = self.years[lo] if lo < hi else 0
+            yhi = self.years[hi - 1] if lo < hi else -1
+
+            def in_years(bid: str) -> bool:
+                y = books[bid].get("published_year")
+                return isinstance(y, int) and ylo <= y <= yhi
+
+            postings.append(
+                (
+                    self.year_offsets[hi] - self.year_offsets[lo] if lo < hi else 0,
+                    lambda: _union(self.by_year, self.years[lo:hi]),
+                    in_years,
+                )
+            )
+        if created_after is not None:
+            cstart = bisect_right(self.created_keys, _naive_utc(created_after))
+            postings.append(
+                (
+                    len(self.created_ids) - cstart,
+                    lambda: self.created_ids[cstart:],
+                    lambda bid: self.created_rank.get(bid, -1) >= cstart,
+                )
+            )
+        if updated_since is not None:
+            ustart = bisect_left(self.updated_keys, _naive_utc(updated_since))
+            postings.append(
+                (
+                    len(self.updated_ids) - ustart,
+                    lambda: self.updated_ids[ustart:],
+                    lambda bid: self.updated_rank.get(bid, -1) >= ustart,
+                )
+            )
+
+        candidates: Iterable[str] = books.keys()
+        if postings:
+            # Materialize only the smallest posting and probe it against the rest
+            postings.sort(key=lambda p: p[0])
+            size, materialize, _ = postings[0]
+            checks = [contains for _, _, contains in postings[1:]]
+            candidates = (
+                [bid for bid in materialize() if all(c(bid) for c in checks)] if size else []
+            )
 
         # Materialize
         items = [books[bid] for bid in candidates]
@@ -57,7 +218,11 @@ class Indexer:
         # Filters
         if q:
             ql = q.strip().lower()
-            items = [b for b in items if ql in (b.get("title", "").lower() + " " + b.get("author", "").lower())]
+            items = [
+                b
+                for b in items
+                if ql in (b.get("title", "").lower() + " " + b.get("author", "").lower())
+            ]
         if available is not None:
             if available:
                 items = [b for b in items if (b.get("available_copies", 0) or 0) > 0]
@@ -4,6 +4,7 @@ import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
+from uuid import uuid4
 
 from filelock import FileLock
 
@@ -16,6 +17,7 @@ class JsonStore:
         lock_file: str,
         enable_backups: bool = True,
         backup_every_n_writes: int = 50,
+        max_changes: int = 1000,
     ) -> None:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -28,11 +30,13 @@ class JsonStore:
         self._writes = 0
         self._enable_backups = enable_backups
         self._backup_every = max(1, backup_every_n_writes)
+        self._max_changes = max(1, max_changes)
         self._ensure_file()
 
     def _ensure_file(self) -> None:
         if not self.data_path.exists():
-            initial = {"version": 1, "books": {}}
+            initial = {"version": 1, "books": {}, "changes": {"epoch": uuid4().hex}}
+            self._ensure_changes(initial)
             self._sync_write(initial)
         self._sync_load()
 
@@ -74,6 +78,36 @@ class JsonStore:
                         # Best-effort backup
                         pass
 
+    @staticmethod
+    def _ensure_changes(data: Dict[str, Any]) -> Dict[str, Any]:
+        changes = data.setdefault("changes", {})
+        # Files written before epochs existed get a fixed one, stable across restarts
+        changes.setdefault("epoch", "0")
+        changes.setdefault("seq", 0)
+        changes.setdefault("entries", [])
+        return changes
+
+    def _append_change(
+        self, data: Dict[str, Any], op: str, book_id: str, book_data: Optional[Dict[str, Any]]
+    ) -> int:
+        # Bounded ring buffer of sequenced mutations, persisted alongside the books
+        changes = self._ensure_changes(data)
+        seq = int(changes["seq"]) + 1
+        entries = changes["entries"]
+        entries.append(
+            {
+                "seq": seq,
+                "op": op,
+                "id": book_id,
+                "at": datetime.utcnow().isoformat(),
+                "book": dict(book_data) if book_data is not None else None,
+            }
+        )
+        if len(entries) > self._max_changes:
+            del entries[: len(entries) - self._max_changes]
+        changes["seq"] = seq
+        return seq
+
     # Public API
     async def health(self) -> Dict[str, Any]:
         return {
@@ -88,17 +122,20 @@ class JsonStore:
     async def replace_all(self, data: Dict[str, Any]) -> None:
         await self._write(data)
 
-    async def upsert_book(self, book_id: str, book_data: Dict[str, Any]) -> None:
+    async def upsert_book(self, book_id: str, book_data: Dict[str, Any], op: str = "update") -> int:
         data = await self._read()
         books = data.setdefault("books", {})
         books[book_id] = book_data
+        seq = self._append_change(data, op, book_id, book_data)
         await self._write(data)
+        return seq
 
     async def delete_book(self, book_id: str) -> bool:
         data = await self._read()
         books = data.get("books", {})
         existed = books.pop(book_id, None) is not None
         if existed:
+            self._append_change(data, "delete", book_id, None)
             await self._write(data)
         return existed
 
@@ -106,6 +143,17 @@ class JsonStore:
         data = await self._read()
         return data.get("books", {}).get(book_id)
 
+    async def get_changes(self) -> Dict[str, Any]:
+        data = await self._read()
+        return self._ensure_changes(data)
+
+    async def reset_changes_epoch(self) -> str:
+        data = await self._read()
+        changes = self._ensure_changes(data)
+        changes["epoch"] = uuid4().hex
+        await self._write(data)
+        return changes["epoch"]
+
     async def list_books(self) -> Tuple[int, Dict[str, Dict[str, Any]]]:
         data = await self._read()
         books = data.get("books", {})
@@ -4,7 +4,12 @@ import pytest
 @pytest.mark.asyncio
 async def test_crud_flow(client):
     # Create
-    payload = {"title": "The Hobbit", "author": "J.R.R. Tolkien", "genres": ["fantasy"], "total_copies": 3}
+    payload = {
+        "title": "The Hobbit",
+        "author": "J.R.R. Tolkien",
+        "genres": ["fantasy"],
+        "total_copies": 3,
+    }
     r = await client.post("/api/v1/books", json=payload)
     assert r.status_code == 201, r.text
     book = r.json()
@@ -34,3 +39,94 @@ async def test_crud_flow(client):
     # Not found after delete
     r = await client.get(f"/api/v1/books/{book_id}")
     assert r.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_range_and_multi_value_filters(client):
+    books = [
+        {
+            "title": "Neuromancer",
+            "author": "William Gibson",
+            "published_year": 1984,
+            "genres": ["sci-fi"],
+        },
+        {
+            "title": "American Gods",
+            "author": "Neil Gaiman",
+            "published_year": 2001,
+            "genres": ["fantasy"],
+        },
+        {
+            "title": "Stardust",
+            "author": "Neil Gaiman",
+            "published_year": 1999,
+            "genres": ["fantasy"],
+        },
+        {
+            "title": "Pattern Recognition",
+            "author": "William Gibson",
+            "published_year": 2003,
+            "genres": ["sci-fi"],
+        },
+        {
+            "title": "Snow Crash",
+            "author": "Neal Stephenson",
+            "published_year": 1992,
+            "genres": ["sci-fi"],
+        },
+        {
+            "title": "Possession",
+            "author": "A.S. Byatt",
+            "published_year": 1990,
+            "genres": ["literary"],
+        },
+        {
+            "title": "The Hobbit",
+            "author": "Tolkien, J.R.R.",
+            "published_year": 1937,
+            "genres": ["fantasy"],
+        },
+    ]
+    ids = {}
+    for b in books:
+        r = await client.post("/api/v1/books", json=b)
+        assert r.status_code == 201, r.text
+        ids[b["title"]] = r.json()
+
+    async def titles(**params):
+        r = await client.get("/api/v1/books", params={"limit": 100, **params})
+        assert r.status_code == 200, r.text
+        return sorted(item["title"] for item in r.json()["items"])
+
+    assert await titles(year_from=1990, year_to=2000, genre="fantasy,sci-fi") == [
+        "Snow Crash",
+        "Stardust",
+    ]
+    assert await titles(year_from=2000) == ["American Gods", "Pattern Recognition"]
+    assert await titles(year_to=1989) == ["Neuromancer", "The Hobbit"]
+    assert await titles(author="neil gaiman, Neal Stephenson", year_to=2000) == [
+        "Snow Crash",
+        "Stardust",
+    ]
+    assert await titles(author=["Neil Gaiman", "William Gibson"], year_from=2000) == [
+        "American Gods",
+        "Pattern Recognition",
+    ]
+    assert await titles(author="Tolkien, J.R.R.") == ["The Hobbit"]
+    assert await titles(year_from=2005) == []
+    assert await titles(author=",") == []
+    assert await titles(genre=" , ") == []
+
+    # Expected sets come from the stored timestamps so equal clock readings can't flake
+    created = ids["Pattern Recognition"]["created_at"]
+    expected = sorted(t for t, b in ids.items() if b["created_at"] > created)
+    assert await titles(created_after=created) == expected
+
+    r = await client.put(f"/api/v1/books/{ids['Neuromancer']['id']}", json={"total_copies": 2})
+    assert r.status_code == 200
+    updated = r.json()["updated_at"]
+    expected = sorted(
+        ["Neuromancer"]
+        + [t for t, b in ids.items() if t != "Neuromancer" and b["updated_at"] >= updated]
+    )
+    assert await titles(updated_since=updated) == expected
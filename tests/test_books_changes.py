@@ -0,0 +1,210 @@
+import asyncio
+import json
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.v1.routers.books import _change_events, list_changes
+from app.domain.schemas import BookCreate
+from app.main import create_app
+
+
+def _stub_request(app):
+    async def is_disconnected():
+        return False
+
+    return SimpleNamespace(app=app, is_disconnected=is_disconnected)
+
+
+async def _read_events(stream, count):
+    events = []
+    async for chunk in stream:
+        if chunk.startswith(":"):
+            continue
+        fields = dict(line.split(": ", 1) for line in chunk.strip().split("\n"))
+        events.append(fields)
+        if len(events) == count:
+            break
+    await stream.aclose()
+    return events
+
+
+@pytest.mark.asyncio
+async def test_change_feed_sequence(client):
+    r = await client.post("/api/v1/books", json={"title": "Dune", "author": "Frank Herbert"})
+    assert r.status_code == 201
+    bid = r.json()["id"]
+    r = await client.put(f"/api/v1/books/{bid}", json={"total_copies": 2})
+    assert r.status_code == 200
+    r = await client.delete(f"/api/v1/books/{bid}")
+    assert r.status_code == 204
+
+    r = await client.get("/api/v1/books/changes", params={"since": 0})
+    assert r.status_code == 200
+    data = r.json()
+    assert [c["op"] for c in data["items"]] == ["create", "update", "delete"]
+    assert [c["seq"] for c in data["items"]] == [1, 2, 3]
+    assert data["items"][0]["book"]["title"] == "Dune"
+    assert data["items"][2]["book"] is None
+    assert data["latest_seq"] == 3
+    assert data["next_since"] == 3
+
+    # Only deltas past the cursor
+    r = await client.get("/api/v1/books/changes", params={"since": 2})
+    assert [c["seq"] for c in r.json()["items"]] == [3]
+
+    # Cursor ahead of the feed must resync
+    r = await client.get("/api/v1/books/changes", params={"since": 10})
+    assert r.status_code == 410
+
+
+@pytest.mark.asyncio
+async def test_change_feed_long_poll(client):
+    async def poll():
+        return await client.get("/api/v1/books/changes", params={"since": 0, "timeout": 5})
+
+    task = asyncio.create_task(poll())
+    await asyncio.sleep(0.05)
+    assert not task.done()
+    r = await client.post("/api/v1/books", json={"title": "Emma", "author": "Jane Austen"})
+    assert r.status_code == 201
+    r = await asyncio.wait_for(task, 2)
+    assert r.status_code == 200
+    assert [c["op"] for c in r.json()["items"]] == ["create"]
+
+
+@pytest.mark.asyncio
+async def test_change_feed_is_bounded(tmp_data_dir, monkeypatch):
+    monkeypatch.setenv("CHANGE_FEED_MAX_ENTRIES", "2")
+    async with AsyncClient(app=create_app(), base_url="http://test") as client:
+        for i in range(4):
+            r = await client.post("/api/v1/books", json={"title": f"T{i}", "author": "A"})
+            assert r.status_code == 201
+
+        r = await client.get("/api/v1/books/changes", params={"since": 2})
+        assert [c["seq"] for c in r.json()["items"]] == [3, 4]
+        r = await client.get("/api/v1/books/changes", params={"since": 0})
+        assert r.status_code == 410
+
+    # Sequence survives a restart since the feed is persisted with the store
+    async with AsyncClient(app=create_app(), base_url="http://test") as client:
+        r = await client.get("/api/v1/books/changes", params={"since": 3})
+        assert r.json()["latest_seq"] == 4
+
+
+@pytest.mark.asyncio
+async def test_change_feed_stale_cursor_is_gone_without_waiting(tmp_data_dir, monkeypatch):
+    # A buffer size of 0 is treated as 1
+    monkeypatch.setenv("CHANGE_FEED_MAX_ENTRIES", "0")
+    async with AsyncClient(app=create_app(), base_url="http://test") as client:
+        for i in range(3):
+            r = await client.post("/api/v1/books", json={"title": f"T{i}", "author": "A"})
+            assert r.status_code == 201
+
+        started = time.monotonic()
+        r = await client.get("/api/v1/books/changes", params={"since": 0, "timeout": 5})
+        assert r.status_code == 410
+        assert time.monotonic() - started < 1
+        r = await client.get("/api/v1/books/changes", params={"since": 2})
+        assert [c["seq"] for c in r.json()["items"]] == [3]
+
+
+@pytest.mark.asyncio
+async def test_change_feed_last_event_id_header(client):
+    for title in ("Dune", "Emma", "Ulysses"):
+        r = await client.post("/api/v1/books", json={"title": title, "author": "A"})
+        assert r.status_code == 201
+    epoch = (await client.get("/api/v1/books/changes")).json()["epoch"]
+
+    r = await client.get("/api/v1/books/changes", headers={"Last-Event-ID": "2"})
+    assert [c["seq"] for c in r.json()["items"]] == [3]
+    r = await client.get("/api/v1/books/changes", headers={"Last-Event-ID": f"{epoch}:2"})
+    assert [c["seq"] for c in r.json()["items"]] == [3]
+    r = await client.get("/api/v1/books/changes", headers={"Last-Event-ID": "other:2"})
+    assert r.status_code == 410
+    r = await client.get("/api/v1/books/changes", headers={"Last-Event-ID": "abc"})
+    assert r.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_change_feed_seq_going_backwards(client, tmp_data_dir):
+    data_file = tmp_data_dir / "books.json"
+    r = await client.post("/api/v1/books", json={"title": "Dune", "author": "A"})
+    assert r.status_code == 201
+    snapshot = data_file.read_bytes()
+    for title in ("Emma", "Ulysses"):
+        r = await client.post("/api/v1/books", json={"title": title, "author": "A"})
+        assert r.status_code == 201
+    epoch = (await client.get("/api/v1/books/changes")).json()["epoch"]
+
+    # Restore the older file under the running service
+    data_file.write_bytes(snapshot)
+    later = time.time() + 10
+    os.utime(data_file, (later, later))
+
+    started = time.monotonic()
+    r = await client.get("/api/v1/books/changes", params={"since": 3, "timeout": 5})
+    assert r.status_code == 410
+    assert time.monotonic() - started < 1
+
+    # Cursors from before the restore no longer line up with the seq numbers
+    r = await client.get("/api/v1/books/changes", params={"since": 1, "epoch": epoch})
+    assert r.status_code == 410
+
+    # Long-poll at the restored head waits instead of returning at once
+    started = time.monotonic()
+    r = await client.get("/api/v1/books/changes", params={"since": 1, "timeout": 0.3})
+    assert r.status_code == 200
+    assert r.json()["items"] == []
+    assert r.json()["epoch"] != epoch
+    assert time.monotonic() - started >= 0.25
+
+
+@pytest.mark.asyncio
+async def test_change_feed_sse(tmp_data_dir):
+    app = create_app()
+    svc = app.state.books_service
+    for title in ("Dune", "Emma", "Ulysses"):
+        await svc.create_book(BookCreate(title=title, author="A"))
+    request = _stub_request(app)
+    _, _, epoch = await svc.list_changes()
+
+    events = await _read_events(_change_events(request, 0, None, 100, 0.05), 3)
+    assert [e["id"] for e in events] == [f"{epoch}:1", f"{epoch}:2", f"{epoch}:3"]
+    assert [e["event"] for e in events] == ["create"] * 3
+    assert json.loads(events[0]["data"])["book"]["title"] == "Dune"
+
+    # Last-Event-ID takes precedence over since
+    resp = await list_changes(
+        request,
+        since=0,
+        epoch=None,
+        limit=100,
+        timeout=0.05,
+        accept="text/event-stream",
+        last_event_id=f"{epoch}:2",
+    )
+    assert resp.media_type == "text/event-stream"
+    events = await _read_events(resp.body_iterator, 1)
+    assert events[0]["id"] == f"{epoch}:3"
+
+
+@pytest.mark.asyncio
+async def test_change_feed_sse_reset(tmp_data_dir, monkeypatch):
+    monkeypatch.setenv("CHANGE_FEED_MAX_ENTRIES", "1")
+    app = create_app()
+    svc = app.state.books_service
+    for title in ("Dune", "Emma"):
+        await svc.create_book(BookCreate(title=title, author="A"))
+    request = _stub_request(app)
+
+    events = await _read_events(_change_events(request, 0, None, 100, 0.05), 1)
+    assert events[0]["event"] == "reset"
+    assert "resync" in json.loads(events[0]["data"])["detail"]
+
+    # A cursor from another epoch is reset as well
+    events = await _read_events(_change_events(request, 2, "other", 100, 0.05), 1)
+    assert events[0]["event"] == "reset"